@@ -19,9 +19,14 @@ Usage:
 import pandas as pd
 import numpy as np
 import random
+import bisect
+import itertools
 import json
 import csv
 import os
+import pickle
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Tuple, Optional
 import argparse
@@ -29,6 +34,44 @@ import calendar
 from pathlib import Path
 import uuid
 
+# PyArrow is optional: its C++ CSV writer is 5-10x faster than pandas'
+# row formatter, but we fall back to pandas when it isn't installed
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pacsv = None
+
+# Numba is optional too: when present, the business-metric kernel below is
+# JIT-compiled into one fused parallel multiply-round pass
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _business_metrics_kernel(amounts, mdr_rates, cost_rates):
+        """Fused MDR/cost/net-profit kernel over the daily batch"""
+        n = amounts.size
+        out_mdr = np.empty(n)
+        out_cost = np.empty(n)
+        out_net = np.empty(n)
+        for i in prange(n):
+            out_mdr[i] = round(amounts[i] * mdr_rates[i], 2)
+            out_cost[i] = round(amounts[i] * cost_rates[i], 2)
+            out_net[i] = round(amounts[i] * mdr_rates[i] - amounts[i] * cost_rates[i], 2)
+        return out_mdr, out_cost, out_net
+else:
+    def _business_metrics_kernel(amounts, mdr_rates, cost_rates):
+        """MDR/cost/net-profit over the daily batch (vectorized fallback)"""
+        out_mdr = np.round(amounts * mdr_rates, 2)
+        out_cost = np.round(amounts * cost_rates, 2)
+        out_net = np.round(amounts * mdr_rates - amounts * cost_rates, 2)
+        return out_mdr, out_cost, out_net
+
 # Import configuration
 from config import (
     BUSINESS_CONFIG, MERCHANT_SIZE_CONFIGS, PAYMENT_CONFIG, 
@@ -37,6 +80,9 @@ from config import (
 
 
 class PaymentsDataGeneratorV2:
+    # Rough per-row CSV size used to preallocate monthly transaction files
+    ESTIMATED_ROW_BYTES = 200
+
     def __init__(self, output_dir: str = "./raw_data", debug: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
@@ -53,6 +99,7 @@ class PaymentsDataGeneratorV2:
         
         # State management
         self.merchants_file = self.output_dir / "merchants.json"
+        self.state_snapshot_file = self.output_dir / "merchants.state.pkl"
         self.state = self.load_state()
         
         # Initialize transaction counter for fast ID generation
@@ -70,6 +117,27 @@ class PaymentsDataGeneratorV2:
         # Cache current merchants to avoid expensive lookups
         self._current_merchants_cache = {}
         self._rebuild_current_merchants_cache()
+
+        # Precomputed size distribution so the scalar sampling path is one
+        # random() plus one bisect, with no per-call list rebuilding
+        self._size_choices = tuple(self.config['merchant_size_distribution'].keys())
+        self._size_cum_weights = tuple(
+            itertools.accumulate(self.config['merchant_size_distribution'].values())
+        )
+
+        # Shared NumPy generator for batched draws - one C-level bulk call per
+        # day instead of per-row random.uniform/random.choice round-trips
+        self._rng = np.random.default_rng()
+        self._card_types = ['credit', 'debit']
+        self._card_brands = ['Visa', 'Mastercard', 'American Express', 'Discover']
+        self._card_issuers = ['Chase', 'Bank of America', 'Wells Fargo', 'Citi', 'Capital One']
+        # Cost-rate lookup table indexed by (card type, card brand) so the
+        # per-row dict lookup becomes a vectorized fancy-index
+        self._cost_rate_lut = np.array([
+            [self.transactional_costs.get((card_type, card_brand), 0.015)
+             for card_brand in self._card_brands]
+            for card_type in self._card_types
+        ])
         
         # Initialize card profile cache
         self._cached_card_profile_keys = list(self.state['card_profiles'].keys())
@@ -93,7 +161,16 @@ class PaymentsDataGeneratorV2:
             print(f"🐛 DEBUG: State loaded: {len(self.state.get('merchants', {}))} merchants")
 
     def load_state(self) -> Dict:
-        """Load generation state from merchants.json file"""
+        """Load generation state, preferring the pickle snapshot over JSON
+
+        The pickle protocol-5 snapshot loads several times faster than
+        re-parsing merchants.json; the JSON file stays the human-readable
+        source of truth and wins whenever it is newer (e.g. hand-edited).
+        """
+        if (self.state_snapshot_file.exists() and self.merchants_file.exists()
+                and self.state_snapshot_file.stat().st_mtime >= self.merchants_file.stat().st_mtime):
+            with open(self.state_snapshot_file, 'rb') as f:
+                return pickle.load(f)
         if self.merchants_file.exists():
             with open(self.merchants_file, 'r') as f:
                 return json.load(f)
@@ -106,9 +183,12 @@ class PaymentsDataGeneratorV2:
         }
 
     def save_state(self):
-        """Save current generation state to merchants.json"""
+        """Save current generation state to merchants.json plus a fast snapshot"""
         with open(self.merchants_file, 'w') as f:
             json.dump(self.state, f, indent=2, default=str)
+        # Written second so its mtime marks it as current for load_state
+        with open(self.state_snapshot_file, 'wb') as f:
+            pickle.dump(self.state, f, protocol=5)
 
     def initialize_state(self):
         """Initialize state if it doesn't exist"""
@@ -132,13 +212,16 @@ class PaymentsDataGeneratorV2:
 
     def assign_merchant_size(self) -> str:
         """Assign merchant size based on distribution"""
-        rand = random.random()
-        cumulative = 0
-        for size, prob in self.config['merchant_size_distribution'].items():
-            cumulative += prob
-            if rand <= cumulative:
-                return size
-        return 'small'
+        idx = bisect.bisect_left(self._size_cum_weights, random.random())
+        if idx >= len(self._size_choices):
+            return 'small'
+        return self._size_choices[idx]
+
+    def assign_merchant_sizes(self, n: int) -> List[str]:
+        """Assign sizes for n merchants in one bulk draw instead of n scalar ones"""
+        sizes = list(self.config['merchant_size_distribution'].keys())
+        probs = list(self.config['merchant_size_distribution'].values())
+        return self._rng.choice(sizes, size=n, p=probs).tolist()
 
     def generate_merchant(self, merchant_id: str, creation_date: date, size: str = None) -> Dict:
         """Generate a single merchant record"""
@@ -473,8 +556,8 @@ class PaymentsDataGeneratorV2:
         
         return transaction
 
-    def generate_daily_transactions(self, target_date: date) -> List[Dict]:
-        """Generate all transactions for a given date"""
+    def generate_daily_transactions(self, target_date: date) -> pd.DataFrame:
+        """Generate all transactions for a given date as a columnar DataFrame"""
         transactions = []
         
         # Get active merchants from cache (much faster)
@@ -520,53 +603,156 @@ class PaymentsDataGeneratorV2:
         if repeated_transactions > 0:
             print(f"   Generated {repeated_transactions} repeated card transactions")
         
-        # Generate transactions for each merchant
+        # The "does this merchant transact today?" rate only depends on size
+        # category and the calendar day, so compute one rate per size and
+        # resolve all merchants with a single vectorized draw instead of one
+        # is_merchant_active_on_date call each
+        days_in_month = calendar.monthrange(target_date.year, target_date.month)[1]
+        is_weekend = target_date.weekday() >= 5
+        size_rates = {}
+        for size, size_config in self.size_configs.items():
+            rate = size_config['active_days_per_month'] / days_in_month
+            if is_weekend:
+                rate *= self.seasonal_config['weekend_multiplier']
+            size_rates[size] = rate
+        merchant_rates = np.array([size_rates[m['size_category']] for m in active_merchants])
+        active_mask = self._rng.random(len(active_merchants)) < merchant_rates
+
+        # Plan transaction counts per merchant first so all random draws for
+        # the day can be made in a few bulk NumPy calls instead of per-row
+        tx_plan = []  # (merchant, tx_count) pairs
         for i, merchant in enumerate(active_merchants):
             if i % 200 == 0:  # Progress every 200 merchants (less verbose)
                 print(f"   Processing merchant {i+1}/{len(active_merchants)}...")
-            if not self.is_merchant_active_on_date(merchant, target_date):
+            if not active_mask[i]:
                 continue
-            
+
             size = merchant['size_category']
             config = self.size_configs[size]
-            
+
             # Number of transactions for this merchant today
             tx_count = random.randint(*config['daily_tx_range'])
-            
+
             # Seasonal adjustment
             if target_date.month in self.seasonal_config['holiday_months']:
                 tx_count = int(tx_count * self.seasonal_config['holiday_multiplier'])
             elif target_date.month in self.seasonal_config['summer_months']:
                 tx_count = int(tx_count * self.seasonal_config['summer_multiplier'])
-            
-            # Pre-generate time components for all transactions to reduce random calls
+
             if tx_count > 0:
-                hours = [random.randint(8, 22) for _ in range(tx_count)]
-                minutes = [random.randint(0, 59) for _ in range(tx_count)]
-                seconds = [random.randint(0, 59) for _ in range(tx_count)]
-                
-                # Generate transactions throughout the day
-                for j in range(tx_count):
-                    transaction_time = datetime.combine(target_date, datetime.min.time()) + timedelta(
-                        hours=hours[j], minutes=minutes[j], seconds=seconds[j]
-                    )
-                    
-                    transaction = self.generate_transaction_with_card_profile(merchant, target_date, transaction_time)
-                    transactions.append(transaction)
-        
+                tx_plan.append((merchant, tx_count))
+
+        n = sum(count for _, count in tx_plan)
+
+        if n > 0:
+            rng = self._rng
+
+            # Per-row amount bounds follow each merchant's size category
+            amount_ranges = {'small': (5, 100), 'medium': (25, 300), 'large': (100, 1000)}
+            counts = [count for _, count in tx_plan]
+            bounds = [amount_ranges.get(m['size_category'], amount_ranges['medium']) for m, _ in tx_plan]
+            lows = np.repeat([b[0] for b in bounds], counts)
+            highs = np.repeat([b[1] for b in bounds], counts)
+            amounts = rng.uniform(lows, highs).round(2)
+
+            # Bulk draws for all remaining per-row attributes
+            hours = rng.integers(8, 23, n)
+            minutes = rng.integers(0, 60, n)
+            seconds = rng.integers(0, 60, n)
+            card_type_idx = rng.integers(0, len(self._card_types), n)
+            card_brand_idx = rng.integers(0, len(self._card_brands), n)
+            card_types = np.asarray(self._card_types)[card_type_idx]
+            card_brands = np.asarray(self._card_brands)[card_brand_idx]
+            card_issuers = rng.choice(self._card_issuers, n)
+            payment_types = rng.choice(self.payment_config['payment_types'], n)
+            statuses = rng.choice(
+                list(self.payment_config['payment_statuses'].keys()), n,
+                p=list(self.payment_config['payment_statuses'].values())
+            )
+            lats = rng.uniform(self.geo_config['us_bounds']['lat_min'], self.geo_config['us_bounds']['lat_max'], n).round(6)
+            lngs = rng.uniform(self.geo_config['us_bounds']['lng_min'], self.geo_config['us_bounds']['lng_max'], n).round(6)
+            card_profile_nums = rng.integers(100000, 1000000, n)
+            card_bins = rng.integers(100000, 1000000, n)
+            terminal_nums = rng.integers(1000, 10000, n)
+            store_card_draws = rng.random(n)
+
+            # Business metrics in one fused kernel pass over the day's batch
+            mdr_rates = np.repeat([m['mdr_rate'] for m, _ in tx_plan], counts)
+            cost_rates = self._cost_rate_lut[card_type_idx, card_brand_idx]
+            mdr_amounts, cost_amounts, net_profits = _business_metrics_kernel(
+                amounts, mdr_rates, cost_rates
+            )
+
+            # Assemble the day's rows as columns - ids, timestamps and the
+            # terminal/profile strings are all built with array ops so no
+            # per-row dict ever exists
+            counters = np.arange(self.transaction_counter + 1, self.transaction_counter + n + 1)
+            self.transaction_counter += n
+            payment_ids = np.char.add('TXN', np.char.zfill(counters.astype('U10'), 10))
+
+            midnight = np.datetime64(datetime.combine(target_date, datetime.min.time()))
+            offsets = (hours * 3600 + minutes * 60 + seconds).astype('timedelta64[s]')
+            timestamps = np.datetime_as_string(midnight + offsets, unit='s')
+
+            card_profile_ids = np.char.add('CARD', card_profile_nums.astype(str))
+            terminal_ids = np.where(
+                payment_types == 'card_present',
+                np.char.add('T', terminal_nums.astype(str)),
+                None
+            )
+            merchant_ids = np.repeat([m['merchant_id'] for m, _ in tx_plan], counts)
+
+            day_df = pd.DataFrame({
+                'payment_id': payment_ids,
+                'payment_timestamp': timestamps,
+                'payment_lat': lats,
+                'payment_lng': lngs,
+                'payment_amount': amounts,
+                'payment_type': payment_types,
+                'terminal_id': terminal_ids,
+                'card_type': card_types,
+                'card_issuer': card_issuers,
+                'card_brand': card_brands,
+                'card_profile_id': card_profile_ids,
+                'card_bin': card_bins.astype(str),
+                'payment_status': statuses,
+                'merchant_id': merchant_ids,
+                'transactional_cost_rate': cost_rates,
+                'transactional_cost_amount': cost_amounts,
+                'mdr_amount': mdr_amounts,
+                'net_profit': net_profits
+            })
+
+            # Very low probability to store cards for future reuse; only the
+            # ~1% of rows that hit the threshold are visited
+            for idx in np.nonzero(store_card_draws < 0.01)[0]:
+                self.add_card_profile_to_state({
+                    'card_profile_id': card_profile_ids[idx],
+                    'card_bin': str(card_bins[idx]),
+                    'card_type': card_types[idx],
+                    'card_issuer': card_issuers[idx],
+                    'card_brand': card_brands[idx]
+                })
+        else:
+            day_df = pd.DataFrame(columns=self.transaction_columns)
+
+        # Repeated-card rows (built per-row above, there are only a handful)
+        # go first to preserve the original output order
+        if transactions:
+            day_df = pd.concat(
+                [pd.DataFrame(transactions, columns=self.transaction_columns), day_df],
+                ignore_index=True
+            )
+
         # Update last transaction date for all merchants that had transactions (once per day, not per transaction)
-        updated_merchants = set()
-        for transaction in transactions:
-            merchant_id = transaction['merchant_id']
-            if merchant_id not in updated_merchants:
-                current = self._current_merchants_cache.get(merchant_id)
-                if current:
-                    # Update in place without creating a new version
-                    current['last_transaction_date'] = target_date
-                    updated_merchants.add(merchant_id)
-        
-        self.state['total_transactions'] += len(transactions)
-        return transactions
+        for merchant_id in day_df['merchant_id'].unique():
+            current = self._current_merchants_cache.get(merchant_id)
+            if current:
+                # Update in place without creating a new version
+                current['last_transaction_date'] = target_date
+
+        self.state['total_transactions'] += len(day_df)
+        return day_df
 
     def confirm_generation(self, mode: str, start_date: date, end_date: date, auto_confirm: bool = False) -> bool:
         """Ask for confirmation before generation"""
@@ -624,6 +810,9 @@ class PaymentsDataGeneratorV2:
         current_date = start_date.replace(day=1)  # Start of first month
         total_transactions = 0
         transaction_files = []
+        # Hoist the column list out of the month/day loops; the attribute
+        # lookup and fieldname validation only need to happen once
+        transaction_columns = tuple(self.transaction_columns)
         
         while current_date <= end_date:
             month_end = (current_date + timedelta(days=32)).replace(day=1) - timedelta(days=1)
@@ -645,36 +834,61 @@ class PaymentsDataGeneratorV2:
             
             print(f"   📅 Processing {days_in_month} days in {current_date.strftime('%Y-%m')}...")
             
-            # Initialize monthly file with header
-            with open(month_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=self.transaction_columns)
-                writer.writeheader()
-            
-            day_count = 0
-            while daily_date <= month_end:
-                day_count += 1
-                # Generate merchant updates for this day
-                print(f"   🔄 Day {day_count}/{days_in_month}: Generating merchant updates for {daily_date}...")
-                merchant_updates = self.generate_merchant_updates(daily_date, daily_date)
-                if merchant_updates:
-                    print(f"   ✅ Generated {len(merchant_updates)} merchant updates")
-                else:
-                    print(f"   ✅ No merchant updates needed for {daily_date}")
-                
-                # Generate daily transactions and write immediately to monthly file
-                print(f"   🔄 Day {day_count}/{days_in_month}: Generating daily transactions for {daily_date}...")
-                daily_transactions = self.generate_daily_transactions(daily_date)
-                
-                # Append to monthly file immediately
-                with open(month_file, 'a', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=self.transaction_columns)
-                    writer.writerows(daily_transactions)
-                
-                month_transaction_count += len(daily_transactions)
-                total_transactions += len(daily_transactions)
-                print(f"   ✅ Day {day_count}/{days_in_month}: Generated and saved {len(daily_transactions)} transactions (Total: {total_transactions:,})")
-                
-                daily_date += timedelta(days=1)
+            # Keep a single handle open for the whole month and preallocate the
+            # expected extent up front, so per-day appends don't churn the
+            # filesystem's extent metadata. The file is truncated back to its
+            # real size once the month is complete.
+            # 1 MiB userspace buffer so the per-day to_csv appends coalesce
+            # into large write() syscalls. A single-worker emitter thread
+            # formats and writes day N while day N+1 is being generated;
+            # one worker keeps the appends in chronological order.
+            with open(month_file, 'w', newline='', buffering=1 << 20) as f, \
+                    ThreadPoolExecutor(max_workers=1) as emitter:
+                f.write(','.join(transaction_columns) + '\n')
+                emit_futures = []
+
+                estimated_month_bytes = (
+                    self.config['daily_transaction_volume'] * days_in_month
+                    * self.ESTIMATED_ROW_BYTES
+                )
+                try:
+                    os.posix_fallocate(f.fileno(), 0, estimated_month_bytes)
+                except (AttributeError, OSError):
+                    pass  # Preallocation is best-effort (not available everywhere)
+
+                day_count = 0
+                while daily_date <= month_end:
+                    day_count += 1
+                    # Generate merchant updates for this day
+                    print(f"   🔄 Day {day_count}/{days_in_month}: Generating merchant updates for {daily_date}...")
+                    merchant_updates = self.generate_merchant_updates(daily_date, daily_date)
+                    if merchant_updates:
+                        print(f"   ✅ Generated {len(merchant_updates)} merchant updates")
+                    else:
+                        print(f"   ✅ No merchant updates needed for {daily_date}")
+
+                    # Generate daily transactions and write immediately to monthly file
+                    print(f"   🔄 Day {day_count}/{days_in_month}: Generating daily transactions for {daily_date}...")
+                    daily_transactions = self.generate_daily_transactions(daily_date)
+
+                    # Append to monthly file off-thread (columnar write,
+                    # no per-row formatting) while the next day generates
+                    emit_futures.append(
+                        emitter.submit(daily_transactions.to_csv, f, header=False, index=False)
+                    )
+
+                    month_transaction_count += len(daily_transactions)
+                    total_transactions += len(daily_transactions)
+                    print(f"   ✅ Day {day_count}/{days_in_month}: Generated and saved {len(daily_transactions)} transactions (Total: {total_transactions:,})")
+
+                    daily_date += timedelta(days=1)
+
+                # Wait for outstanding appends (surfacing any write errors),
+                # then trim unused preallocated space back off the file
+                for future in emit_futures:
+                    future.result()
+                f.flush()
+                os.ftruncate(f.fileno(), os.lseek(f.fileno(), 0, os.SEEK_CUR))
             
             transaction_files.append(month_file)
             print(f"   💾 Monthly file complete: {month_transaction_count} transactions in {month_file}")
@@ -721,13 +935,14 @@ class PaymentsDataGeneratorV2:
             count = min(self.config['initial_merchants'], 500)  # Cap at 500 merchants
         
         print(f"🔄 Generating {count} initial merchants...")
-        merchants = []
+        merchants = [None] * count  # Pre-sized: no growth reallocations while filling
+        sizes = self.assign_merchant_sizes(count)  # One bulk draw for all sizes
         for i in range(count):
             if i % 100 == 0:  # Progress indicator every 100 merchants
                 print(f"   Progress: {i}/{count} merchants generated...")
             merchant_id = self.generate_merchant_id()
-            merchant = self.generate_merchant(merchant_id, start_date)
-            merchants.append(merchant)
+            merchant = self.generate_merchant(merchant_id, start_date, size=sizes[i])
+            merchants[i] = merchant
             self.add_merchant_to_state(merchant)
         
         print(f"✅ Completed generating {count} merchants")
@@ -770,13 +985,13 @@ class PaymentsDataGeneratorV2:
             # Generate transactions for the day
             print(f"   🔄 Generating daily transactions for {current_date}...")
             daily_transactions = self.generate_daily_transactions(current_date)
-            all_transactions.extend(daily_transactions)
+            all_transactions.append(daily_transactions)
             total_transactions += len(daily_transactions)
             print(f"   ✅ Generated {len(daily_transactions)} transactions (Total: {total_transactions:,})")
-            
-            # Track merchants that had activity
-            for transaction in daily_transactions:
-                all_merchants.add(transaction['merchant_id'])
+
+            # Track merchants that had activity (set.update consumes the
+            # deduplicated column in C instead of one .add() call per row)
+            all_merchants.update(daily_transactions['merchant_id'].unique())
             
             current_date += timedelta(days=1)
         
@@ -787,7 +1002,11 @@ class PaymentsDataGeneratorV2:
         
         # Save files
         print("🔄 Saving data files...")
-        self.save_data_files(start_date, end_date, merchants, all_transactions)
+        transactions_df = (
+            pd.concat(all_transactions, ignore_index=True) if all_transactions
+            else pd.DataFrame(columns=self.transaction_columns)
+        )
+        self.save_data_files(start_date, end_date, merchants, transactions_df)
         print("✅ Data files saved")
         
         # Update state
@@ -820,7 +1039,38 @@ class PaymentsDataGeneratorV2:
         
         return merchants
 
-    def save_data_files(self, start_date: date, end_date: date, merchants: List[Dict], transactions: List[Dict]):
+    def _write_records_to_csv(self, records, file_path: Path):
+        """Write rows (DataFrame or list of dicts) through Arrow's C++ CSV writer when available"""
+        if isinstance(records, pd.DataFrame):
+            if pa is None:
+                records.to_csv(file_path, index=False, na_rep='')
+            else:
+                pacsv.write_csv(
+                    pa.Table.from_pandas(records, preserve_index=False), str(file_path),
+                    write_options=pacsv.WriteOptions(include_header=True, batch_size=65536)
+                )
+            return
+
+        if pa is None:
+            pd.DataFrame(records).to_csv(file_path, index=False, na_rep='')
+            return
+
+        columns = list(records[0].keys())
+        arrays = {}
+        for column in columns:
+            values = [record.get(column) for record in records]
+            # Arrow columns must be uniformly typed; dates mixed with empty
+            # strings (e.g. churn_date) are normalized to ISO strings
+            if any(isinstance(v, (date, datetime)) for v in values):
+                values = [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+            arrays[column] = values
+
+        pacsv.write_csv(
+            pa.table(arrays), str(file_path),
+            write_options=pacsv.WriteOptions(include_header=True)
+        )
+
+    def save_data_files(self, start_date: date, end_date: date, merchants: List[Dict], transactions: pd.DataFrame):
         """Save merchant and transaction data to CSV files"""
         # Generate file names
         date_suffix = f"{start_date}_{end_date}"
@@ -829,8 +1079,7 @@ class PaymentsDataGeneratorV2:
         
         # Save merchants
         if merchants:
-            merchants_df = pd.DataFrame(merchants)
-            merchants_df.to_csv(merchants_file, index=False)
+            self._write_records_to_csv(merchants, merchants_file)
             print(f"✅ Saved {len(merchants)} merchants to {merchants_file}")
         else:
             # Create empty file with headers
@@ -843,9 +1092,8 @@ class PaymentsDataGeneratorV2:
             print(f"✅ Created empty merchants file: {merchants_file}")
         
         # Save transactions
-        if transactions:
-            transactions_df = pd.DataFrame(transactions)
-            transactions_df.to_csv(transactions_file, index=False)
+        if transactions is not None and len(transactions):
+            self._write_records_to_csv(transactions, transactions_file)
             print(f"✅ Saved {len(transactions)} transactions to {transactions_file}")
         else:
             # Create empty file with headers
@@ -860,17 +1108,40 @@ class PaymentsDataGeneratorV2:
             print(f"✅ Created empty transactions file: {transactions_file}")
     
     def combine_monthly_files(self, monthly_files: List[Path], output_file: Path):
-        """Combine monthly transaction files using streaming to avoid memory issues"""
-        with open(output_file, 'w', newline='') as outfile:
+        """Combine monthly transaction files without pulling them through Python
+
+        Each source is advised for sequential readahead and copied with
+        os.sendfile (kernel-to-kernel, no userspace round-trip). Falls back
+        to a buffered stream copy on platforms without sendfile.
+        """
+        with open(output_file, 'wb') as outfile:
+            out_fd = outfile.fileno()
             for i, monthly_file in enumerate(monthly_files):
-                with open(monthly_file, 'r') as infile:
-                    if i == 0:
-                        # First file: copy header and all data
-                        outfile.write(infile.read())
-                    else:
-                        # Subsequent files: skip header, copy data only
-                        next(infile)  # Skip header
-                        outfile.write(infile.read())
+                with open(monthly_file, 'rb') as infile:
+                    in_fd = infile.fileno()
+                    try:
+                        os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except (AttributeError, OSError):
+                        pass
+
+                    # Subsequent files: skip header, copy data only
+                    offset = 0
+                    if i > 0:
+                        infile.readline()
+                        offset = infile.tell()
+
+                    remaining = os.fstat(in_fd).st_size - offset
+                    try:
+                        while remaining > 0:
+                            sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                            if sent == 0:
+                                break
+                            offset += sent
+                            remaining -= sent
+                    except (AttributeError, OSError):
+                        # sendfile unavailable: stream the rest through userspace
+                        infile.seek(offset)
+                        shutil.copyfileobj(infile, outfile)
     
     def save_merchants_to_csv(self, merchants: List[Dict], file_path: Path):
         """Save merchants to CSV file"""
@@ -886,9 +1157,8 @@ class PaymentsDataGeneratorV2:
                     merchant['change_type'] = ''
                 if merchant['churn_date'] is None:
                     merchant['churn_date'] = ''
-            
-            merchants_df = pd.DataFrame(merchants)
-            merchants_df.to_csv(file_path, index=False, na_rep='')
+
+            self._write_records_to_csv(merchants, file_path)
         else:
             # Create empty file with headers
             empty_df = pd.DataFrame(columns=[
@@ -898,11 +1168,10 @@ class PaymentsDataGeneratorV2:
             ])
             empty_df.to_csv(file_path, index=False)
     
-    def save_transactions_to_csv(self, transactions: List[Dict], file_path: Path):
-        """Save transactions to CSV file"""
-        if transactions:
-            transactions_df = pd.DataFrame(transactions)
-            transactions_df.to_csv(file_path, index=False)
+    def save_transactions_to_csv(self, transactions, file_path: Path):
+        """Save transactions (DataFrame or list of dicts) to CSV file"""
+        if transactions is not None and len(transactions):
+            self._write_records_to_csv(transactions, file_path)
         else:
             # Create empty file with headers
             empty_df = pd.DataFrame(columns=[
@@ -11,9 +11,10 @@ if [[ "$VIRTUAL_ENV" == "" ]]; then
     source venv/bin/activate
 fi
 
-# Run tests with pytest
+# Run tests with pytest (in parallel across cores - each test works in
+# its own temp directory so they are safe to distribute)
 echo "🔍 Running unit tests..."
-pytest tests/ -v --tb=short
+pytest tests/ -v --tb=short -n auto
 
 # Run tests with coverage
 echo ""
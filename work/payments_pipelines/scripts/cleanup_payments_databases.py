@@ -32,25 +32,18 @@ def cleanup_database(spark, db_name, force=False):
         # Use the same Iceberg catalog as the ingestion process
         iceberg_catalog = "iceberg"
         
-        # List tables in the database
-        try:
-            tables_df = spark.sql(f'SHOW TABLES IN {iceberg_catalog}.{db_name}')
-            tables = [row[1] for row in tables_df.collect()]  # Use index for table name
-            print(f"  Found {len(tables)} tables to drop: {tables}")
-        except Exception as e:
-            print(f"  ⚠️ Could not list tables in {iceberg_catalog}.{db_name}: {e}")
-            tables = []
-        
-        # Drop all tables first
-        for table_name in tables:
-            print(f"    Dropping table: {iceberg_catalog}.{db_name}.{table_name}")
+        # List tables for logging only - DROP DATABASE ... CASCADE below
+        # removes them all in a single round-trip, so no per-table DROP loop.
+        # With --force the listing round-trip is skipped entirely.
+        if not force:
             try:
-                spark.sql(f'DROP TABLE IF EXISTS {iceberg_catalog}.{db_name}.{table_name}')
-                print(f"      ✅ Successfully dropped {iceberg_catalog}.{db_name}.{table_name}")
+                tables_df = spark.sql(f'SHOW TABLES IN {iceberg_catalog}.{db_name}')
+                tables = [row[1] for row in tables_df.collect()]  # Use index for table name
+                print(f"  Found {len(tables)} tables to drop: {tables}")
             except Exception as e:
-                print(f"      ⚠️ Failed to drop {iceberg_catalog}.{db_name}.{table_name}: {e}")
-        
-        # Drop the database using CASCADE
+                print(f"  ⚠️ Could not list tables in {iceberg_catalog}.{db_name}: {e}")
+
+        # Drop the database using CASCADE (drops contained tables too)
         print(f"  Dropping database: {iceberg_catalog}.{db_name}")
         try:
             spark.sql(f'DROP DATABASE IF EXISTS {iceberg_catalog}.{db_name} CASCADE')
@@ -93,12 +86,13 @@ def main():
     else:
         databases_to_clean = ['payments_bronze', 'payments_silver', 'payments_silver_staging']
     
-    # Check which databases actually exist in the Iceberg catalog
+    # Check which databases actually exist with pointed catalog lookups
+    # instead of collecting every namespace just to test membership
     iceberg_catalog = "iceberg"
-    existing_databases = spark.sql(f'SHOW NAMESPACES IN {iceberg_catalog}').collect()
-    existing_db_names = [row[0] for row in existing_databases]  # Use index instead of column name
-    
-    databases_to_clean = [db for db in databases_to_clean if db in existing_db_names]
+    databases_to_clean = [
+        db for db in databases_to_clean
+        if spark.catalog.databaseExists(f'{iceberg_catalog}.{db}')
+    ]
     
     if not databases_to_clean:
         print("✅ No payments databases found to clean up")
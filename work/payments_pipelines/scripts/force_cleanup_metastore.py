@@ -29,38 +29,37 @@ def cleanup_metastore():
         
         # Find tables in payments_bronze database
         cursor.execute("""
-            SELECT t.TBL_NAME, t.TBL_ID, s.LOCATION
+            SELECT t.TBL_NAME, t.TBL_ID, t.SD_ID, s.LOCATION
             FROM "TBLS" t
             JOIN "DBS" d ON t.DB_ID = d.DB_ID
             JOIN "SDS" s ON t.SD_ID = s.SD_ID
             WHERE d."NAME" = 'payments_bronze'
         """)
-        
+
         tables = cursor.fetchall()
         print(f"Found {len(tables)} tables in payments_bronze database:")
-        
-        for table_name, table_id, location in tables:
+
+        for table_name, table_id, sd_id, location in tables:
             print(f"  - {table_name} (ID: {table_id}, Location: {location})")
-        
+
         if not tables:
             print("✅ No tables found in payments_bronze database")
             return
-        
-        # Remove table references
-        print("\n🗑️ Removing orphaned table references...")
-        
-        for table_name, table_id, location in tables:
-            print(f"  Removing {table_name} (ID: {table_id})...")
-            
-            # Delete from TBLS
-            cursor.execute("DELETE FROM \"TBLS\" WHERE \"TBL_ID\" = %s", (table_id,))
-            
-            # Delete from SDS (storage descriptor)
-            cursor.execute("DELETE FROM \"SDS\" WHERE \"SD_ID\" = %s", (table_id,))
-            
-            print(f"    ✅ Removed {table_name}")
-        
-        # Commit changes
+
+        # Remove all table references with one set-based DELETE per
+        # metastore table instead of two round-trips per orphaned table
+        print(f"\n🗑️ Removing {len(tables)} orphaned table references...")
+
+        tbl_ids = [table_id for _, table_id, _, _ in tables]
+        sd_ids = [sd_id for _, _, sd_id, _ in tables]
+
+        # Delete from TBLS
+        cursor.execute('DELETE FROM "TBLS" WHERE "TBL_ID" = ANY(%s)', (tbl_ids,))
+
+        # Delete from SDS (storage descriptors)
+        cursor.execute('DELETE FROM "SDS" WHERE "SD_ID" = ANY(%s)', (sd_ids,))
+
+        # Commit changes (single transaction, commit cost paid once)
         conn.commit()
         print("\n✅ Successfully cleaned up metastore references")
         
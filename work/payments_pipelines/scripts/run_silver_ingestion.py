@@ -13,9 +13,13 @@ from pathlib import Path
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
+from pyspark import StorageLevel
+from pyspark.sql.functions import broadcast
+
 from payments_pipeline.silver.silver_ingestion import SilverIngestionJob
 from payments_pipeline.utils.spark import get_spark_session
 from payments_pipeline.utils.config import PipelineConfig
+from payments_pipeline.utils.logging import setup_logging
 
 
 def main():
@@ -28,55 +32,78 @@ def main():
     parser.add_argument('--stats', action='store_true', help='Show silver layer statistics only')
     
     args = parser.parse_args()
-    
-    print("🚀 Starting Silver Layer Ingestion")
+
+    # Shared queue-backed logger: status lines are emitted off-thread
+    # instead of flushing stdout synchronously at every step
+    logger = setup_logging(__name__)
+    logger.info("🚀 Starting Silver Layer Ingestion")
     
     # Initialize configuration
     config = PipelineConfig()
     
     # Initialize Spark session
     spark = get_spark_session()
-    
+
+    # Silver shuffles (SCD joins, window functions) are where AQE pays off
+    # most; set the knobs at runtime so they hold even when an externally
+    # created session is being reused
+    spark.conf.set("spark.sql.adaptive.enabled", "true")
+    spark.conf.set("spark.sql.adaptive.coalescePartitions.enabled", "true")
+    spark.conf.set("spark.sql.adaptive.skewJoin.enabled", "true")
+    spark.conf.set("spark.sql.adaptive.advisoryPartitionSizeInBytes", "128m")
+
     # Initialize silver ingestion job
     job = SilverIngestionJob(spark_session=spark)
     
     # Handle stats-only mode
     if args.stats:
         stats = job.get_silver_layer_stats()
-        print("\n📊 Silver Layer Statistics:")
+        logger.info("📊 Silver Layer Statistics:")
         for key, value in stats.items():
-            print(f"  {key}: {value}")
+            logger.info(f"  {key}: {value}")
         return
     
     # Create silver layer tables if they don't exist
-    print("🏗️ Creating silver layer tables if needed...")
+    logger.info("🏗️ Creating silver layer tables if needed...")
     job.atomic_updater.create_silver_tables()
     
-    # Read bronze data
-    print("📖 Reading bronze data...")
-    bronze_merchants_df = spark.table(f"{config.iceberg_catalog}.{config.bronze_namespace}.merchants_raw")
-    bronze_payments_df = spark.table(f"{config.iceberg_catalog}.{config.bronze_namespace}.transactions_raw")
-    
+    # Read bronze data and persist it: the silver pipeline consumes each
+    # frame more than once, and every unmaterialized reference would
+    # otherwise re-scan compressed parquet from S3
+    logger.info("📖 Reading bronze data...")
+    bronze_merchants_df = spark.table(f"{config.iceberg_catalog}.{config.bronze_namespace}.merchants_raw") \
+        .persist(StorageLevel.MEMORY_AND_DISK)
+    bronze_payments_df = spark.table(f"{config.iceberg_catalog}.{config.bronze_namespace}.transactions_raw") \
+        .persist(StorageLevel.MEMORY_AND_DISK)
+
     # Run silver layer pipeline
     processing_mode = "historical" if args.historical_mode else args.processing_window
-    print(f"🔄 Running silver layer pipeline ({processing_mode})...")
-    success = job.run_complete_silver_pipeline(
-        bronze_merchants_df,
-        bronze_payments_df,
-        args.processing_window,
-        args.historical_mode
-    )
-    
+    logger.info(f"🔄 Running silver layer pipeline ({processing_mode})...")
+    try:
+        # Merchants is a small dimension next to the payments fact table;
+        # the broadcast hint steers its SCD comparison joins away from a
+        # SortMergeJoin that would shuffle the large side
+        success = job.run_complete_silver_pipeline(
+            broadcast(bronze_merchants_df),
+            bronze_payments_df,
+            args.processing_window,
+            args.historical_mode
+        )
+    finally:
+        # Release executor memory before the stats queries run
+        bronze_merchants_df.unpersist()
+        bronze_payments_df.unpersist()
+
     if success:
-        print("🎉 Silver layer ingestion completed successfully")
+        logger.info("🎉 Silver layer ingestion completed successfully")
         
         # Show statistics
         stats = job.get_silver_layer_stats()
-        print("\n📊 Silver Layer Statistics:")
+        logger.info("📊 Silver Layer Statistics:")
         for key, value in stats.items():
-            print(f"  {key}: {value}")
+            logger.info(f"  {key}: {value}")
     else:
-        print("❌ Silver layer ingestion failed")
+        logger.error("❌ Silver layer ingestion failed")
         sys.exit(1)
 
 
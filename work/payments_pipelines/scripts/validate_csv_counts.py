@@ -34,8 +34,8 @@ def validate_csv_counts():
     
     for csv_file in sorted(csv_files):
         try:
-            # Read CSV file
-            df = pd.read_csv(csv_file)
+            # Read CSV file (pyarrow engine parses multi-threaded in C++)
+            df = pd.read_csv(csv_file, engine="pyarrow")
             record_count = len(df)
             
             # Determine file type
@@ -7,7 +7,7 @@ Provides data quality validation functions for ingested data.
 import logging
 from typing import Dict, List, Any
 from pyspark.sql import DataFrame, SparkSession
-from pyspark.sql.functions import col, count, isnan, isnull, when
+from pyspark.sql.functions import col, count, countDistinct, isnan, isnull, when, sum as spark_sum
 
 
 class DataQualityValidator:
@@ -103,19 +103,22 @@ class DataQualityValidator:
             "passed": len(type_mismatches) == 0
         }
     
-    def validate_row_count(self, df: DataFrame, min_rows: int = 1, max_rows: int = None) -> Dict[str, Any]:
+    def validate_row_count(self, df: DataFrame, min_rows: int = 1, max_rows: int = None,
+                           row_count: int = None) -> Dict[str, Any]:
         """
         Validate row count is within expected range
-        
+
         Args:
             df: DataFrame to validate
             min_rows: Minimum expected rows
             max_rows: Maximum expected rows (optional)
-            
+            row_count: Precomputed row count, to avoid re-scanning the table
+
         Returns:
             Validation results dictionary
         """
-        row_count = df.count()
+        if row_count is None:
+            row_count = df.count()
         
         passed = row_count >= min_rows
         if max_rows is not None:
@@ -129,13 +132,14 @@ class DataQualityValidator:
             "passed": passed
         }
     
-    def validate_merchants_data(self, df: DataFrame) -> Dict[str, Any]:
+    def validate_merchants_data(self, df: DataFrame, row_count: int = None) -> Dict[str, Any]:
         """
         Validate merchants data quality
-        
+
         Args:
             df: Merchants DataFrame to validate
-            
+            row_count: Precomputed row count, to avoid an extra scan
+
         Returns:
             Validation results dictionary
         """
@@ -144,16 +148,33 @@ class DataQualityValidator:
         # Required columns for merchants
         required_columns = ["merchant_id", "merchant_name", "size_category", "status"]
         results["required_columns"] = self.validate_required_columns(df, required_columns)
-        
-        # Key columns should not have nulls
+
+        # One aggregation pass computes the row count and every null
+        # counter instead of a separate scan per check
         key_columns = ["merchant_id", "merchant_name"]
-        results["null_validation"] = self.validate_null_values(df, key_columns)
-        
+        present_keys = [c for c in key_columns if c in df.columns]
+        agg_row = df.agg(
+            count("*").alias("__rows"),
+            countDistinct("merchant_id").alias("__distinct_keys"),
+            *[spark_sum(col(c).isNull().cast("long")).alias(f"__nulls_{c}") for c in present_keys]
+        ).collect()[0]
+
+        null_counts = {c: agg_row[f"__nulls_{c}"] for c in present_keys}
+        results["null_validation"] = {
+            "validation_type": "null_values",
+            "key_columns": key_columns,
+            "null_counts": null_counts,
+            "passed": all(null_count == 0 for null_count in null_counts.values())
+        }
+
         # Row count validation
-        results["row_count"] = self.validate_row_count(df, min_rows=1)
+        results["row_count"] = self.validate_row_count(
+            df, min_rows=1, row_count=row_count if row_count is not None else agg_row["__rows"])
         
-        # Check for duplicate merchant IDs
-        duplicate_count = df.groupBy("merchant_id").count().filter(col("count") > 1).count()
+        # Check for duplicate merchant IDs: surplus rows over distinct keys,
+        # a hash aggregate inside the same pass instead of a wide
+        # groupBy/filter/count chain
+        duplicate_count = agg_row["__rows"] - agg_row["__distinct_keys"]
         results["duplicates"] = {
             "validation_type": "duplicate_merchant_ids",
             "duplicate_count": duplicate_count,
@@ -170,13 +191,14 @@ class DataQualityValidator:
         
         return results
     
-    def validate_transactions_data(self, df: DataFrame) -> Dict[str, Any]:
+    def validate_transactions_data(self, df: DataFrame, row_count: int = None) -> Dict[str, Any]:
         """
         Validate transactions data quality
-        
+
         Args:
             df: Transactions DataFrame to validate
-            
+            row_count: Precomputed row count, to avoid an extra scan
+
         Returns:
             Validation results dictionary
         """
@@ -185,16 +207,38 @@ class DataQualityValidator:
         # Required columns for transactions
         required_columns = ["payment_id", "merchant_id", "payment_amount", "payment_status"]
         results["required_columns"] = self.validate_required_columns(df, required_columns)
-        
-        # Key columns should not have nulls
+
+        # Row count, null, amount and status checks fused into one
+        # aggregation pass instead of a separate full scan per check
+        valid_statuses = ["approved", "declined", "cancelled"]
         key_columns = ["payment_id", "merchant_id"]
-        results["null_validation"] = self.validate_null_values(df, key_columns)
-        
+        present_keys = [c for c in key_columns if c in df.columns]
+        aggs = [count("*").alias("__rows")]
+        if "payment_id" in df.columns:
+            aggs.append(countDistinct("payment_id").alias("__distinct_keys"))
+        aggs += [spark_sum(col(c).isNull().cast("long")).alias(f"__nulls_{c}") for c in present_keys]
+        if "payment_amount" in df.columns:
+            aggs.append(spark_sum((col("payment_amount") <= 0).cast("long")).alias("__negative_amounts"))
+        if "payment_status" in df.columns:
+            aggs.append(spark_sum((~col("payment_status").isin(valid_statuses)).cast("long")).alias("__invalid_statuses"))
+        agg_row = df.agg(*aggs).collect()[0]
+
+        null_counts = {c: agg_row[f"__nulls_{c}"] for c in present_keys}
+        results["null_validation"] = {
+            "validation_type": "null_values",
+            "key_columns": key_columns,
+            "null_counts": null_counts,
+            "passed": all(null_count == 0 for null_count in null_counts.values())
+        }
+
         # Row count validation
-        results["row_count"] = self.validate_row_count(df, min_rows=1)
+        results["row_count"] = self.validate_row_count(
+            df, min_rows=1, row_count=row_count if row_count is not None else agg_row["__rows"])
         
-        # Check for duplicate payment IDs
-        duplicate_count = df.groupBy("payment_id").count().filter(col("count") > 1).count()
+        # Check for duplicate payment IDs: surplus rows over distinct keys,
+        # computed in the same aggregation pass
+        duplicate_count = (agg_row["__rows"] - agg_row["__distinct_keys"]
+                           if "payment_id" in df.columns else 0)
         results["duplicates"] = {
             "validation_type": "duplicate_payment_ids",
             "duplicate_count": duplicate_count,
@@ -202,7 +246,7 @@ class DataQualityValidator:
         }
         
         # Validate payment amounts are positive
-        negative_amounts = df.filter(col("payment_amount") <= 0).count()
+        negative_amounts = agg_row["__negative_amounts"] if "payment_amount" in df.columns else 0
         results["amount_validation"] = {
             "validation_type": "positive_amounts",
             "negative_count": negative_amounts,
@@ -210,8 +254,7 @@ class DataQualityValidator:
         }
         
         # Validate payment status values
-        valid_statuses = ["approved", "declined", "cancelled"]
-        invalid_statuses = df.filter(~col("payment_status").isin(valid_statuses)).count()
+        invalid_statuses = agg_row["__invalid_statuses"] if "payment_status" in df.columns else 0
         results["status_validation"] = {
             "validation_type": "valid_statuses",
             "invalid_count": invalid_statuses,
@@ -243,27 +286,31 @@ class DataQualityValidator:
         
         try:
             df = self.spark.table(table_name)
-            
+
+            # Count once and share the value with the per-type validators
+            # instead of paying a second full scan for their row check
+            row_count = df.count()
+
             validation_results = {
                 "table_name": table_name,
                 "timestamp": self.spark.sql("SELECT current_timestamp()").collect()[0][0],
                 "basic_stats": {
-                    "row_count": df.count(),
+                    "row_count": row_count,
                     "column_count": len(df.columns),
                     "columns": df.columns
                 }
             }
-            
+
             # Run specific validations based on table type
             if "merchants" in table_name.lower():
-                validation_results["data_quality"] = self.validate_merchants_data(df)
+                validation_results["data_quality"] = self.validate_merchants_data(df, row_count=row_count)
             elif "transactions" in table_name.lower():
-                validation_results["data_quality"] = self.validate_transactions_data(df)
+                validation_results["data_quality"] = self.validate_transactions_data(df, row_count=row_count)
             else:
                 # Generic validation
                 validation_results["data_quality"] = {
                     "required_columns": self.validate_required_columns(df, ["id"]),
-                    "row_count": self.validate_row_count(df),
+                    "row_count": self.validate_row_count(df, row_count=row_count),
                     "overall_passed": True
                 }
             
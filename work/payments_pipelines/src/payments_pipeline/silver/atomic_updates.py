@@ -17,7 +17,7 @@ from pyspark.sql.functions import (
     col, current_timestamp, lit, hash, concat, 
     when, isnull, isnan, date_format, year, month, dayofweek,
     max as spark_max, min as spark_min, count as spark_count,
-    weekofyear, dayofyear, date_sub
+    weekofyear, dayofyear, date_sub, broadcast
 )
 from pyspark.sql.types import StructType, StructField, StringType, TimestampType, DateType, LongType
 
@@ -409,7 +409,7 @@ class AtomicSilverUpdater:
         
         # Get all current versions for these merchants
         old_versions_df = current_df.alias("current") \
-            .join(changed_merchant_ids.alias("changed"), 
+            .join(broadcast(changed_merchant_ids.alias("changed")), 
                   col("current.merchant_id") == col("changed.merchant_id"), 
                   "inner") \
             .select(col("current.*"))
@@ -419,7 +419,7 @@ class AtomicSilverUpdater:
         
         # Join to get the new effective date for each merchant
         expired_versions_df = old_versions_df.alias("old") \
-            .join(new_effective_dates.alias("new"), 
+            .join(broadcast(new_effective_dates.alias("new")), 
                   col("old.merchant_id") == col("new.merchant_id"), 
                   "inner") \
             .select(
@@ -457,7 +457,7 @@ class AtomicSilverUpdater:
         # Get merchants that are NOT in the changes (unchanged merchants)
         # These should remain as-is (keep their current is_current status)
         unchanged_merchants_df = current_df.alias("current") \
-            .join(changed_merchant_ids.alias("changed"), 
+            .join(broadcast(changed_merchant_ids.alias("changed")), 
                   col("current.merchant_id") == col("changed.merchant_id"), 
                   "left_anti")  # left_anti gives us records in current but NOT in changed
         
@@ -8,6 +8,7 @@ Orchestrates the complete silver layer pipeline.
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 from pathlib import Path
@@ -149,39 +150,43 @@ class SilverIngestionJob:
         """Get silver layer statistics"""
         try:
             stats = {}
-            
-            # Merchants stats
-            merchants_df = self.spark.table(f"{self.config.iceberg_catalog}.{self.config.silver_namespace}.dim_merchants")
-            stats["merchants"] = {
-                "total_count": merchants_df.count(),
-                "current_count": merchants_df.filter(col("is_current") == True).count(),
-                "historical_count": merchants_df.filter(col("is_current") == False).count()
-            }
-            
-            # Payments stats
-            payments_df = self.spark.table(f"{self.config.iceberg_catalog}.{self.config.silver_namespace}.fact_payments")
-            payments_agg = payments_df.agg(
-                spark_count("*").alias("total_count"),
-                spark_max("payment_amount").alias("max_amount"),
-                spark_min("payment_amount").alias("min_amount")
-            ).collect()[0]
-            
+
+            def merchants_stats():
+                merchants_df = self.spark.table(f"{self.config.iceberg_catalog}.{self.config.silver_namespace}.dim_merchants")
+                return {
+                    "total_count": merchants_df.count(),
+                    "current_count": merchants_df.filter(col("is_current") == True).count(),
+                    "historical_count": merchants_df.filter(col("is_current") == False).count()
+                }
+
+            def payments_stats():
+                payments_df = self.spark.table(f"{self.config.iceberg_catalog}.{self.config.silver_namespace}.fact_payments")
+                payments_agg = payments_df.agg(
+                    spark_count("*").alias("total_count"),
+                    spark_max("payment_amount").alias("max_amount"),
+                    spark_min("payment_amount").alias("min_amount"),
+                    spark_min("payment_date").alias("min_date"),
+                    spark_max("payment_date").alias("max_date")
+                ).collect()[0]
+                return payments_agg
+
+            # The dimension and fact queries are independent; overlap them
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                merchants_future = executor.submit(merchants_stats)
+                payments_future = executor.submit(payments_stats)
+                stats["merchants"] = merchants_future.result()
+                payments_agg = payments_future.result()
+
             stats["payments"] = {
                 "total_count": payments_agg["total_count"],
                 "max_amount": payments_agg["max_amount"],
                 "min_amount": payments_agg["min_amount"]
             }
-            
-            # Date range
-            date_stats = payments_df.agg(
-                spark_min("payment_date").alias("min_date"),
-                spark_max("payment_date").alias("max_date")
-            ).collect()[0]
             stats["date_range"] = {
-                "start_date": date_stats["min_date"],
-                "end_date": date_stats["max_date"]
+                "start_date": payments_agg["min_date"],
+                "end_date": payments_agg["max_date"]
             }
-            
+
             return stats
             
         except Exception as e:
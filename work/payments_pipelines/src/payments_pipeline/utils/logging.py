@@ -2,13 +2,45 @@
 Logging Configuration
 
 Centralized logging setup for the payments pipeline.
+
+All loggers funnel through one QueueHandler into a background
+QueueListener thread, so log I/O (flushing to the console on every call)
+never blocks the ingestion hot path.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 
+# One shared queue + listener per process; created lazily on first setup
+_log_queue: Optional[queue.Queue] = None
+_log_listener: Optional[QueueListener] = None
+
+
+def _get_log_queue(format_string: str, level: str) -> queue.Queue:
+    """Create the shared log queue and start its listener on first use"""
+    global _log_queue, _log_listener
+
+    if _log_queue is None:
+        _log_queue = queue.Queue(-1)
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(getattr(logging, level.upper()))
+        console_handler.setFormatter(logging.Formatter(format_string))
+
+        _log_listener = QueueListener(
+            _log_queue, console_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+
+    return _log_queue
+
+
 def setup_logging(
     name: str = "PaymentsPipeline",
     level: str = "INFO",
@@ -16,55 +48,51 @@ def setup_logging(
 ) -> logging.Logger:
     """
     Set up logging configuration
-    
+
+    Log records are enqueued and written by a background listener thread
+    instead of flushing synchronously in the caller. The sink format and
+    level are fixed by the first setup_logging call in the process.
+
     Args:
         name: Logger name
         level: Log level (DEBUG, INFO, WARN, ERROR)
         format_string: Custom format string
-        
+
     Returns:
         Configured logger
     """
-    
+
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
+
     # Create logger
     logger = logging.getLogger(name)
-    
+
     # Set level
     logger.setLevel(getattr(logging, level.upper()))
-    
+
     # Remove existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
-    
-    # Create formatter
-    formatter = logging.Formatter(format_string)
-    console_handler.setFormatter(formatter)
-    
-    # Add handler to logger
-    logger.addHandler(console_handler)
-    
+
+    # Route records through the shared queue; the listener thread does the
+    # actual formatting and console I/O
+    logger.addHandler(QueueHandler(_get_log_queue(format_string, level)))
+
     # Prevent propagation to root logger
     logger.propagate = False
-    
+
     return logger
 
 
 def get_logger(name: str) -> logging.Logger:
     """
     Get existing logger or create new one
-    
+
     Args:
         name: Logger name
-        
+
     Returns:
         Logger instance
     """
     return logging.getLogger(name)
-
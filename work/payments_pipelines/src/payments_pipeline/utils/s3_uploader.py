@@ -4,11 +4,14 @@ S3/MinIO Upload Utility
 Handles uploading CSV files from local filesystem to S3/MinIO for Spark access.
 """
 
+import hashlib
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 
@@ -29,6 +32,14 @@ class S3Uploader:
         self.endpoint_url = endpoint_url
         self.bucket_name = bucket_name
         self.logger = logging.getLogger(__name__)
+
+        # Multipart settings shared by every upload (8 MiB threshold,
+        # concurrent part uploads)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            max_concurrency=8,
+            use_threads=True
+        )
         
         # Create S3 client
         self.s3_client = boto3.client(
@@ -70,14 +81,26 @@ class S3Uploader:
             # Check if local file exists
             if not os.path.exists(local_file_path):
                 raise FileNotFoundError(f"Local file not found: {local_file_path}")
-            
-            # Upload file
-            with open(local_file_path, 'rb') as f:
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=s3_key,
-                    Body=f
-                )
+
+            # Skip the transfer entirely when S3 already holds identical
+            # bytes; _local_etag mirrors both the single-part MD5 and the
+            # multipart composite form our transfer config produces
+            try:
+                remote_etag = self.s3_client.head_object(
+                    Bucket=self.bucket_name, Key=s3_key
+                )['ETag'].strip('"')
+                if remote_etag == self._local_etag(local_file_path):
+                    s3_path = f"s3a://{self.bucket_name}/{s3_key}"
+                    self.logger.info(f"⏭️ Skipping unchanged file: {s3_path}")
+                    return s3_path
+            except ClientError:
+                pass  # Object doesn't exist yet - upload it
+
+            # Upload file (multipart + concurrent parts for large files)
+            self.s3_client.upload_file(
+                local_file_path, self.bucket_name, s3_key,
+                Config=self.transfer_config
+            )
             
             s3_path = f"s3a://{self.bucket_name}/{s3_key}"
             self.logger.info(f"✅ Uploaded {local_file_path} to {s3_path}")
@@ -88,6 +111,40 @@ class S3Uploader:
             self.logger.error(f"❌ Failed to upload {local_file_path}: {e}")
             raise
     
+    @staticmethod
+    def _local_md5(local_file_path: str) -> str:
+        """MD5 of a local file, streamed in 1 MiB chunks"""
+        md5 = hashlib.md5()
+        with open(local_file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                md5.update(chunk)
+        return md5.hexdigest()
+
+    def _local_etag(self, local_file_path: str) -> str:
+        """
+        Expected S3 ETag for a local file under this uploader's config
+
+        Files below the multipart threshold get the plain MD5; larger
+        files get the multipart composite (MD5 of the per-part MD5s plus a
+        part-count suffix), chunked at the same part size boto3 uploads
+        with - so large files can short-circuit too, which is where the
+        skip matters most.
+
+        Args:
+            local_file_path: Path to local file
+
+        Returns:
+            ETag string as S3 would report it
+        """
+        if os.path.getsize(local_file_path) < self.transfer_config.multipart_threshold:
+            return self._local_md5(local_file_path)
+
+        part_md5s = []
+        with open(local_file_path, 'rb') as f:
+            for part in iter(lambda: f.read(self.transfer_config.multipart_chunksize), b''):
+                part_md5s.append(hashlib.md5(part).digest())
+        return f"{hashlib.md5(b''.join(part_md5s)).hexdigest()}-{len(part_md5s)}"
+
     def upload_directory(self, local_dir: str, s3_prefix: str = "payments") -> List[str]:
         """
         Upload all CSV files from a directory to S3
@@ -155,18 +212,19 @@ class S3Uploader:
         merchant_files.sort(key=lambda x: self._extract_date_range(x.name))
         transaction_files.sort(key=lambda x: self._extract_date_range(x.name))
         
-        # Upload merchant files
-        for file_path in merchant_files:
-            s3_key = f"payments/{file_path.name}"
-            s3_path = self.upload_file(str(file_path), s3_key)
-            s3_paths["merchants"].append(s3_path)
-            s3_paths["all_files"].append(s3_path)
-        
-        # Upload transaction files
-        for file_path in transaction_files:
-            s3_key = f"payments/{file_path.name}"
-            s3_path = self.upload_file(str(file_path), s3_key)
-            s3_paths["transactions"].append(s3_path)
+        # Upload merchant and transaction files through a bounded thread
+        # pool - PUT latency dominates, so concurrent requests scale nearly
+        # linearly. executor.map preserves the sorted chronological order.
+        upload_plan = ([(f, "merchants") for f in merchant_files]
+                       + [(f, "transactions") for f in transaction_files])
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            uploaded = list(executor.map(
+                lambda item: self.upload_file(str(item[0]), f"payments/{item[0].name}"),
+                upload_plan
+            ))
+
+        for (file_path, category), s3_path in zip(upload_plan, uploaded):
+            s3_paths[category].append(s3_path)
             s3_paths["all_files"].append(s3_path)
         
         self.logger.info(f"✅ Uploaded {len(s3_paths['all_files'])} files:")
@@ -200,34 +258,63 @@ class S3Uploader:
         
         return "9999-99-99_9999-99-99"  # Sort unknown files last
     
+    def _list_objects(self, s3_prefix: str):
+        """
+        Yield every object under a prefix with one paginated bulk LIST
+
+        A single ListObjectsV2 response caps at 1000 keys; the paginator
+        walks all pages so callers see the complete listing in one pass.
+
+        Args:
+            s3_prefix: S3 prefix to list
+        """
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=s3_prefix,
+            PaginationConfig={"PageSize": 1000}
+        ):
+            yield from page.get('Contents', [])
+
     def list_uploaded_files(self, s3_prefix: str = "payments") -> List[str]:
         """
         List files uploaded to S3
-        
+
         Args:
             s3_prefix: S3 prefix to list
-            
+
         Returns:
             List of S3 keys
         """
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=s3_prefix
-            )
-            
-            if 'Contents' in response:
-                keys = [obj['Key'] for obj in response['Contents']]
+            keys = [obj['Key'] for obj in self._list_objects(s3_prefix)]
+            if keys:
                 self.logger.info(f"📋 Found {len(keys)} files in s3://{self.bucket_name}/{s3_prefix}")
-                return keys
             else:
                 self.logger.info(f"📋 No files found in s3://{self.bucket_name}/{s3_prefix}")
-                return []
-                
+            return keys
+
         except Exception as e:
             self.logger.error(f"❌ Failed to list S3 files: {e}")
             return []
     
+    def _delete_keys(self, keys: List[str]):
+        """
+        Delete keys with batched DeleteObjects requests
+
+        S3 accepts up to 1000 keys per DeleteObjects call, so N single
+        deletes collapse into ceil(N/1000) round-trips.
+
+        Args:
+            keys: S3 keys to delete
+        """
+        for start in range(0, len(keys), 1000):
+            batch = keys[start:start + 1000]
+            self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+            )
+
     def delete_file(self, s3_key: str):
         """
         Delete a file from S3
@@ -258,19 +345,14 @@ class S3Uploader:
             else:
                 cutoff_date = datetime.datetime.now() - datetime.timedelta(days=keep_days)
             
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=s3_prefix
-            )
-            
-            if 'Contents' in response:
-                files_deleted = 0
-                for obj in response['Contents']:
-                    if obj['LastModified'].replace(tzinfo=None) < cutoff_date and obj['Key'].endswith('.csv'):
-                        self.delete_file(obj['Key'])
-                        files_deleted += 1
-                
-                self.logger.info(f"🧹 Cleaned up {files_deleted} old files")
+            keys_to_delete = [
+                obj['Key'] for obj in self._list_objects(s3_prefix)
+                if obj['LastModified'].replace(tzinfo=None) < cutoff_date
+                and obj['Key'].endswith(('.csv', '.parquet'))
+            ]
+            self._delete_keys(keys_to_delete)
+
+            self.logger.info(f"🧹 Cleaned up {len(keys_to_delete)} old files")
             
         except Exception as e:
             self.logger.error(f"❌ Failed to cleanup old files: {e}")
@@ -286,20 +368,16 @@ class S3Uploader:
             # Only clean up raw data files, not Iceberg metadata
             # Look for CSV files in the payments prefix, not the database directory
             payments_prefix = "payments/"
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=payments_prefix
-            )
-            
-            if 'Contents' in response:
-                files_deleted = 0
-                for obj in response['Contents']:
-                    # Only delete CSV files (raw data), not Iceberg metadata
-                    if obj['Key'].endswith('.csv'):
-                        self.delete_file(obj['Key'])
-                        files_deleted += 1
-                
-                self.logger.info(f"🧹 Cleaned up {files_deleted} raw data files for {database_name}")
+            # Only delete raw data files (CSV or transcoded Parquet), not
+            # Iceberg metadata
+            keys_to_delete = [
+                obj['Key'] for obj in self._list_objects(payments_prefix)
+                if obj['Key'].endswith(('.csv', '.parquet'))
+            ]
+            self._delete_keys(keys_to_delete)
+
+            if keys_to_delete:
+                self.logger.info(f"🧹 Cleaned up {len(keys_to_delete)} raw data files for {database_name}")
             else:
                 self.logger.info(f"📋 No raw data files found to clean up for {database_name}")
             